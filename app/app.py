@@ -12,12 +12,28 @@ DEFAULT_DATA_PATH = os.path.join(BASE_DIR, 'data', 'sample', 'default.json')
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.data_loader import load_geojson, process_upload
+from backend.search_index import SearchIndex, dataset_key
 from ui.components import render_map, render_charts
 
 st.set_page_config(layout="wide", page_title="تقرير إستبيان حصر المساكن", page_icon="🏢", initial_sidebar_state="expanded")
 
 def reset_zoom():
     st.session_state['zoom_target'] = None
+
+# --- Helper: Search ---
+# الفهرس يُبنى مرة واحدة لكل محتوى بيانات (data_key = بصمة المحتوى) ويُعاد استخدامه في كل إعادة تشغيل
+@st.cache_resource(max_entries=4, show_spinner=False)
+def get_search_index(data_key, _gdf):
+    return SearchIndex(_gdf)
+
+def select_search_result(gdf):
+    idx = st.session_state.get('search_pick')
+    if idx is None or idx not in gdf.index:
+        return
+    geom = gdf.loc[idx].geometry
+    st.session_state['zoom_target'] = geom.bounds if geom is not None and not geom.is_empty else None
+    st.session_state['selected_project_idx'] = idx
+
 # --- Helper: Images ---
 def get_img_as_base64(file_path):
     if not os.path.exists(file_path): return ""
@@ -110,7 +126,24 @@ with st.sidebar:
     gdf = st.session_state['data']
     filtered_gdf = gdf.copy() if not gdf.empty else gpd.GeoDataFrame()
     
-    # 2. كود الفلاتر (وضعناه في الأول ليظهر في الأعلى)
+    # 2. البحث عن موقع بالاسم / المدينة / الجهة المالكة
+    if not gdf.empty:
+        search_index = get_search_index(dataset_key(gdf), gdf)
+        query = st.text_input("🔎 البحث عن موقع", placeholder="اسم الموقع أو المدينة أو الجهة المالكة")
+        if query:
+            hits = search_index.search(query, limit=20)
+            if hits:
+                st.selectbox(
+                    f"نتائج البحث ({len(hits)})", hits, index=None, key='search_pick',
+                    placeholder="اختر موقعاً لعرضه على الخريطة",
+                    format_func=lambda i: f"{' '.join(str(gdf.loc[i, 'project_name']).split())} - {gdf.loc[i, 'city']}",
+                    on_change=select_search_result, args=(gdf,)
+                )
+            else:
+                st.caption("لا توجد نتائج مطابقة.")
+        st.markdown("---")
+
+    # 3. كود الفلاتر
     if not gdf.empty:
         # فلتر المحافظة
         if 'governorate' in gdf.columns:
@@ -164,10 +197,10 @@ with st.sidebar:
         filtered_gdf = gpd.GeoDataFrame()
         st.info("لا توجد بيانات لعرض الفلاتر.")
 
-    # 3. فاصل لتوضيح نهاية الفلاتر
+    # 4. فاصل لتوضيح نهاية الفلاتر
     st.markdown("---")
     
-    # 4. كود رفع البيانات (نقلناه للأسفل)
+    # 5. كود رفع البيانات (نقلناه للأسفل)
     # جعلنا expanded=False عشان ما ياخدش مساحة إلا لو احتاجته
     with st.expander("📂 إدارة البيانات (رفع/حذف)", expanded=False):
         uploaded_file = st.file_uploader("رفع ملف بيانات جديد", type=['xlsx', 'csv', 'geojson', 'json'])
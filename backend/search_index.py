@@ -0,0 +1,165 @@
+import hashlib
+import re
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+# Fields searched and their ranking weight
+SEARCH_FIELDS = {
+    "project_name": 3,
+    "city": 2,
+    "owner": 1,
+}
+
+NGRAM_SIZE = 3
+
+# Match quality of a query word against an indexed token
+EXACT_MATCH, PREFIX_MATCH, SUBSTRING_MATCH = 3, 2, 1
+
+# Tashkeel (harakat, tanween, shadda, sukun, dagger alef) and tatweel
+_DIACRITICS_RE = re.compile(r'[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED\u0640]')
+
+# Punctuation glued to words in the source data, e.g. 'بورسعيد(حي الجنوب)', '(3-4-6)كورنيش'
+_PUNCTUATION_RE = re.compile(r'[^\w\s]|_')
+
+# Unify the letters whose spelling varies between data entry clerks
+_LETTER_MAP = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ة': 'ه',
+    'ى': 'ي', 'ئ': 'ي',
+    'ؤ': 'و',
+    '٠': '0', '١': '1', '٢': '2', '٣': '3', '٤': '4',
+    '٥': '5', '٦': '6', '٧': '7', '٨': '8', '٩': '9',
+})
+
+
+def normalize_arabic(text):
+    """Fold Arabic spelling variants, drop diacritics, split on punctuation and collapse whitespace (incl. \\r\\n)."""
+    if not isinstance(text, str):
+        return ''
+    # Diacritics are not word characters, so they must go before punctuation is replaced by spaces
+    text = _DIACRITICS_RE.sub('', text).translate(_LETTER_MAP).lower()
+    text = _PUNCTUATION_RE.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def dataset_key(df, fields=SEARCH_FIELDS):
+    """Content hash of the index labels and searched columns, used to cache one index per dataset."""
+    cols = [field for field in fields if field in df.columns]
+    hashes = pd.util.hash_pandas_object(pd.DataFrame(df[cols].astype(str)), index=True)
+    return hashlib.sha1(hashes.to_numpy().tobytes()).hexdigest()
+
+
+def _ngrams(token):
+    return {token[i:i + NGRAM_SIZE] for i in range(len(token) - NGRAM_SIZE + 1)}
+
+
+class SearchIndex:
+    """
+    In-memory token index over project_name / city / owner.
+
+    Built once per dataset: every normalized token maps to the rows containing it
+    (stored as flat numpy arrays), and a trigram index over the token vocabulary
+    resolves substring queries without scanning the rows.
+    """
+
+    def __init__(self, df, fields=SEARCH_FIELDS):
+        self.labels = df.index
+        self.size = len(df)
+
+        parts = []
+        for field, weight in fields.items():
+            if field not in df.columns:
+                continue
+            tokens = df[field].map(normalize_arabic).str.split()
+            tokens.index = np.arange(self.size)
+            tokens = tokens.explode().dropna()
+            parts.append(pd.DataFrame({'token': tokens.values, 'pos': tokens.index, 'weight': weight}))
+
+        if parts:
+            postings = pd.concat(parts).groupby(['token', 'pos'])['weight'].max()
+            codes, vocab = pd.factorize(postings.index.get_level_values('token'))
+            self.vocab = list(vocab)
+            self.offsets = np.concatenate([[0], np.cumsum(np.bincount(codes))]).astype(np.int64)
+            self.positions = postings.index.get_level_values('pos').to_numpy(dtype=np.int64)
+            self.weights = postings.to_numpy(dtype=np.float64)
+        else:
+            self.vocab = []
+            self.offsets = np.zeros(1, dtype=np.int64)
+            self.positions = np.zeros(0, dtype=np.int64)
+            self.weights = np.zeros(0, dtype=np.float64)
+
+        self.vocab_arr = np.array(self.vocab, dtype=str)
+        self.vocab_len = np.char.str_len(self.vocab_arr)
+
+        grams = {}
+        for token_id, token in enumerate(self.vocab):
+            for gram in _ngrams(token):
+                grams.setdefault(gram, []).append(token_id)
+        self.grams = {gram: np.array(ids, dtype=np.int64) for gram, ids in grams.items()}
+
+    def _match_tokens(self, word):
+        """Return (token_ids, qualities) arrays for tokens matching a normalized query word."""
+        if len(word) < NGRAM_SIZE:
+            # Too short for trigrams: tokens with this prefix form one contiguous range of the sorted vocabulary
+            start = bisect_left(self.vocab, word)
+            end = bisect_left(self.vocab, word + chr(0x10FFFF), lo=start)
+            token_ids = np.arange(start, end, dtype=np.int64)
+            qualities = np.full(token_ids.size, PREFIX_MATCH, dtype=np.float64)
+            if token_ids.size and self.vocab[start] == word:
+                qualities[0] = EXACT_MATCH
+            return token_ids, qualities
+
+        token_ids = None
+        for gram in sorted(_ngrams(word), key=lambda g: len(self.grams.get(g, ()))):
+            ids = self.grams.get(gram)
+            if ids is None:
+                return np.zeros(0, dtype=np.int64), np.zeros(0)
+            token_ids = ids if token_ids is None else np.intersect1d(token_ids, ids, assume_unique=True)
+            if token_ids.size == 0:
+                return token_ids, np.zeros(0)
+
+        # Sharing every trigram does not imply containment; verify and grade in one pass
+        found = np.char.find(self.vocab_arr[token_ids], word)
+        qualities = np.where(found == 0, PREFIX_MATCH, SUBSTRING_MATCH).astype(np.float64)
+        qualities[(found == 0) & (self.vocab_len[token_ids] == len(word))] = EXACT_MATCH
+        keep = found >= 0
+        return token_ids[keep], qualities[keep]
+
+    def _word_scores(self, word):
+        """Best score per row for one query word (0 where the word does not match)."""
+        word_score = np.zeros(self.size)
+        token_ids, qualities = self._match_tokens(word)
+        if token_ids.size == 0:
+            return word_score
+
+        lo, hi = self.offsets[token_ids], self.offsets[token_ids + 1]
+        lengths = hi - lo
+        if token_ids.size == token_ids[-1] - token_ids[0] + 1:
+            # Contiguous token range (prefix queries): a single slice of the postings
+            postings = np.arange(lo[0], hi[-1])
+        else:
+            postings = np.repeat(lo - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        np.maximum.at(word_score, self.positions[postings], np.repeat(qualities, lengths) * self.weights[postings])
+        return word_score
+
+    def search(self, query, limit=20):
+        """Return the index labels of the best matching rows, ranked by score (all words must match)."""
+        words = normalize_arabic(query).split()
+        if not words or self.size == 0:
+            return []
+
+        total = np.zeros(self.size)
+        matched = np.ones(self.size, dtype=bool)
+        for word in words:
+            word_score = self._word_scores(word)
+            matched &= word_score > 0
+            if not matched.any():
+                return []
+            total += word_score
+
+        hits = np.flatnonzero(matched)
+        # Stable sort keeps the original data order between equal scores
+        order = hits[np.argsort(-total[hits], kind='stable')][:limit]
+        return list(self.labels[order])
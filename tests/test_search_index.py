@@ -0,0 +1,149 @@
+import json
+import os
+import re
+import sys
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATA_PATH = os.path.join(BASE_DIR, 'data', 'sample', 'default.json')
+sys.path.append(BASE_DIR)
+
+from backend.search_index import SearchIndex, dataset_key, normalize_arabic
+
+
+def make_index(rows):
+    return SearchIndex(pd.DataFrame(rows, columns=['project_name', 'city', 'owner']))
+
+
+def test_normalize_folds_letter_variants():
+    assert normalize_arabic('أحمد إسكان آمن ٱلوادي') == 'احمد اسكان امن الوادي'
+    assert normalize_arabic('مدينة') == 'مدينه'
+    assert normalize_arabic('مبنى') == 'مبني'
+
+
+def test_normalize_strips_tashkeel_and_tatweel():
+    assert normalize_arabic('مَسَاكِنٌ') == 'مساكن'
+    assert normalize_arabic('شـــارع') == 'شارع'
+
+
+def test_normalize_collapses_whitespace():
+    assert normalize_arabic('  عمارة سكنية\r\nبورسعيد ') == 'عماره سكنيه بورسعيد'
+    assert normalize_arabic(None) == ''
+
+
+def test_normalize_splits_on_punctuation():
+    assert normalize_arabic('بورسعيد(حي الجنوب)') == 'بورسعيد حي الجنوب'
+    assert normalize_arabic('(1 ،5،2)كورنيش النيل') == '1 5 2 كورنيش النيل'
+    assert normalize_arabic('التمليك H , Z') == 'التمليك h z'
+    assert normalize_arabic('الفيروز ( أ - ب - جـ )') == 'الفيروز ا ب ج'
+
+
+def test_crlf_in_project_name_splits_tokens():
+    index = make_index([['عمارة سكنية بشارع\r\nبورسعيد', 'طنطا', 'المحافظة']])
+    assert index.search('بورسعيد') == [0]
+    assert 'بشارع' in index.vocab
+
+
+def test_search_city_with_parentheses():
+    index = make_index([
+        ['مساكن ب طريق بور سعيد', 'بورسعيد(حي الجنوب)', 'المحافظة'],
+        ['مساكن الجيش', 'بورسعيد(حي الضواحي)', 'المحافظة'],
+    ])
+    assert index.search('حي الجنوب') == [0]
+    assert index.search('الضواحي') == [1]
+
+
+def test_search_real_value_shapes():
+    # Value shapes copied from data/sample/default.json
+    index = make_index([
+        ['(3-4-6)كورنيش النيل', 'أسوان', 'المحافظة'],
+        ['مساكن ب طريق23يوليو1', 'السويس', 'المحافظة'],
+        ['اسكان الشباب ( اسكان مبارك) \nالمرحله الاولى  ', 'الفيوم', 'الإسكان'],
+        ['فيلات شارع 103،101', 'القاهرة', 'المحافظة'],
+        ['عمارات (888)', 'سوهاج', 'المحافظة'],
+        ['ال96وحدة', 'قنا', 'المحافظة'],
+    ])
+    assert index.search('كورنيش النيل') == [0]
+    assert index.search('23يوليو') == [1]
+    assert index.search('اسكان مبارك المرحلة') == [2]
+    assert index.search('101') == [3]
+    assert index.search('888') == [4]
+    assert index.search('96وحده') == [5]
+
+
+def test_default_dataset_vocabulary_has_no_punctuation():
+    with open(DEFAULT_DATA_PATH, 'r', encoding='utf-8') as f:
+        features = json.load(f)['features']
+    columns = {"اسم_الموقع": 'project_name', "المدينة_المركز": 'city', "الجهة_المالكة": 'owner'}
+    df = pd.DataFrame([{col: feat['properties'].get(key) for key, col in columns.items()} for feat in features])
+    index = SearchIndex(df.astype(str))
+    assert not [token for token in index.vocab if re.search(r'[^\w]|_', token)]
+
+
+def test_search_matches_spelling_variants():
+    index = make_index([['إسكان الشباب بالمدينة', 'المنصورة', 'المحافظة']])
+    assert index.search('اسكان المدينه') == [0]
+    assert index.search('المنصوره') == [0]
+
+
+def test_ranking_exact_prefix_substring():
+    index = make_index([
+        ['بالوادي', 'طنطا', 'المحافظة'],
+        ['الواديين', 'طنطا', 'المحافظة'],
+        ['الوادي', 'طنطا', 'المحافظة'],
+    ])
+    assert index.search('الوادي') == [2, 1, 0]
+
+
+def test_ranking_follows_field_weights():
+    index = make_index([
+        ['مساكن', 'طنطا', 'الزهراء'],
+        ['مساكن', 'الزهراء', 'المحافظة'],
+        ['الزهراء', 'طنطا', 'المحافظة'],
+    ])
+    assert index.search('الزهراء') == [2, 1, 0]
+
+
+def test_short_query_uses_prefix():
+    index = make_index([
+        ['مساكن', 'طنطا', 'المحافظة'],
+        ['ال', 'طنطا', 'المحافظة'],
+        ['عمارات', 'أسوان', 'المحافظة'],
+    ])
+    assert index.search('ال') == [1, 0, 2]
+    assert index.search('ع') == [2]
+
+
+def test_every_query_word_must_match():
+    index = make_index([
+        ['مساكن الشباب', 'طنطا', 'المحافظة'],
+        ['مساكن الجيش', 'طنطا', 'المحافظة'],
+    ])
+    assert index.search('مساكن') == [0, 1]
+    assert index.search('مساكن الجيش') == [1]
+    assert index.search('مساكن الشرطة') == []
+
+
+def test_empty_query_returns_nothing():
+    index = make_index([['مساكن', 'طنطا', 'المحافظة']])
+    assert index.search('') == []
+    assert index.search('   ') == []
+    assert index.search('ًٌٍـ') == []
+
+
+def test_search_returns_index_labels():
+    df = pd.DataFrame(
+        [['مساكن الشباب', 'طنطا', 'المحافظة'], ['عمارات', 'أسوان', 'المحافظة']],
+        columns=['project_name', 'city', 'owner'],
+        index=[10, 20],
+    )
+    assert SearchIndex(df).search('اسوان') == [20]
+
+
+def test_dataset_key_tracks_content():
+    df = pd.DataFrame([['مساكن', 'طنطا', 'المحافظة']], columns=['project_name', 'city', 'owner'])
+    changed = df.copy()
+    changed.loc[0, 'city'] = 'أسوان'
+    assert dataset_key(df) == dataset_key(df.copy())
+    assert dataset_key(df) != dataset_key(changed)